@@ -16,11 +16,30 @@ struct TranslationData: Codable {
     let objects: [TranslationItem]
 }
 
+// WordNet category hierarchy generated by scripts/build_category_index.py
+struct CategoryIndex: Codable {
+    struct Category: Codable {
+        let name: String
+        let parents: [String]
+        let depth: Int
+        let labels: [Int]
+    }
+    
+    let labels: [String]
+    // A label can name several synsets, e.g. "crane" (the bird and the machine)
+    let leaves: [[String]]
+    let categories: [String: Category]
+    let names: [String: [String]]
+}
+
 class TranslationManager {
     static let shared = TranslationManager()
     
     private var translationData: TranslationData?
     private var translationDictionary: [String: (chinese: String, pinyin: String)] = [:]
+    private var translationItems: [String: TranslationItem] = [:]
+    private var categoryIndex: CategoryIndex?
+    private var categoryLabelPositions: [String: Int] = [:]
     
     private init() {
         loadTranslations()
@@ -32,6 +51,9 @@ class TranslationManager {
         
         // Then load YOLO translations
         loadYOLOTranslations()
+        
+        // Finally load the category hierarchy
+        loadCategoryIndex()
     }
     
     private func loadMainTranslations() {
@@ -62,6 +84,7 @@ class TranslationManager {
                 // Add YOLO translations to the dictionary
                 for object in yoloTranslations.objects {
                     translationDictionary[object.english.lowercased()] = (chinese: object.chinese, pinyin: object.pinyin)
+                    translationItems[object.english.lowercased()] = object
                 }
                 
                 print("Successfully loaded YOLO translations")
@@ -73,6 +96,25 @@ class TranslationManager {
         }
     }
     
+    private func loadCategoryIndex() {
+        // The category index is optional; without it categories fall back to the raw category field
+        if let url = Bundle.main.url(forResource: "category_index", withExtension: "json") {
+            do {
+                let data = try Data(contentsOf: url)
+                let index = try JSONDecoder().decode(CategoryIndex.self, from: data)
+                for (position, label) in index.labels.enumerated() {
+                    categoryLabelPositions[label.lowercased()] = position
+                }
+                categoryIndex = index
+                print("Successfully loaded category index with \(categoryIndex?.categories.count ?? 0) categories")
+            } catch {
+                print("Error loading category index: \(error)")
+            }
+        } else {
+            print("Category index file not found in bundle")
+        }
+    }
+    
     private func loadFallbackTranslations() {
         // Try to load from the Resources directory
         let paths = [
@@ -105,6 +147,7 @@ class TranslationManager {
         // Build a dictionary for quick lookups
         for object in objects {
             translationDictionary[object.english.lowercased()] = (chinese: object.chinese, pinyin: object.pinyin)
+            translationItems[object.english.lowercased()] = object
         }
         
         print("Built translation dictionary with \(translationDictionary.count) entries")
@@ -138,13 +181,45 @@ class TranslationManager {
         return translationDictionary
     }
     
-    // Get translations by category
+    // Get translations by category, including everything under it in the hierarchy (e.g. "dog" includes "terrier")
     func getTranslations(forCategory category: String) -> [TranslationItem] {
-        return translationData?.objects.filter { $0.category == category } ?? []
+        guard let index = categoryIndex,
+              let synsets = index.names[category.lowercased()] else {
+            return translationData?.objects.filter { $0.category == category } ?? []
+        }
+        
+        var labelIndices = Set<Int>()
+        for synset in synsets {
+            labelIndices.formUnion(index.categories[synset]?.labels ?? [])
+        }
+        
+        return labelIndices.sorted().compactMap { translationItems[index.labels[$0].lowercased()] }
+    }
+    
+    // Get the category path for an object, from the most general category down (e.g. ["animal", "dog", "terrier"]).
+    // Labels with several synsets use the first one.
+    func getCategoryPath(for objectName: String) -> [String] {
+        guard let index = categoryIndex,
+              let labelIndex = categoryLabelPositions[objectName.lowercased()],
+              var synset = index.leaves[labelIndex].first else {
+            return []
+        }
+        
+        var path: [String] = []
+        while let category = index.categories[synset] {
+            path.insert(category.name, at: 0)
+            guard let parent = category.parents.first else { break }
+            synset = parent
+        }
+        return path
     }
     
-    // Get all categories
+    // Get all categories, as names that getTranslations(forCategory:) accepts
     func getAllCategories() -> [String] {
+        if let index = categoryIndex {
+            return Array(Set(index.categories.values.map(\.name))).sorted()
+        }
+
         let categories = translationData?.objects.map { $0.category } ?? []
         return Array(Set(categories)).sorted()
     }
@@ -0,0 +1,597 @@
+#!/usr/bin/env python3
+"""
+Build a hierarchical category index for the vocabulary from WordNet.
+
+Each translation label is mapped to WordNet noun synsets, and every ancestor
+of those synsets (e.g. animal > dog > terrier) gets a precomputed list of the
+labels underneath it. The app can then answer "all words under X" with a
+single dictionary lookup instead of scanning every translation.
+
+ImageNet labels are mapped through their class wnids (`imagenet_classes.txt`,
+in class order) and YOLO labels through an explicit table, because the most
+frequent WordNet sense of a bare word is often a different object ("kite",
+"mouse"). Only labels outside both go through a WordNet sense lookup, and the
+build lists every label that was mapped that way so it can be checked.
+
+The build runs offline from the vendored `wordnet_snapshot.json`, which holds
+only the WordNet 3.0 synsets reachable from our labels. To refresh the snapshot
+after adding labels, point the script at a Princeton WordNet 3.0 database
+directory (the one containing `data.noun` and `index.noun`):
+
+    python build_category_index.py --wordnet-dir /path/to/wordnet-3.0/dict
+"""
+import argparse
+import json
+import os
+from collections import deque
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+RESOURCES_DIR = os.path.join(SCRIPT_DIR, "..", "Tono", "Resources")
+
+DEFAULT_IMAGENET_SOURCES = [os.path.join(RESOURCES_DIR, "translations.json")]
+DEFAULT_YOLO_SOURCES = [os.path.join(RESOURCES_DIR, "yolo_translations.json")]
+DEFAULT_CLASSES = os.path.join(SCRIPT_DIR, "imagenet_classes.txt")
+DEFAULT_SNAPSHOT = os.path.join(SCRIPT_DIR, "wordnet_snapshot.json")
+DEFAULT_OUTPUT = os.path.join(RESOURCES_DIR, "category_index.json")
+
+# Hypernym and instance hypernym pointers in the WordNet data files
+HYPERNYM_POINTERS = {"@", "@i"}
+
+# Lexicographer file for people (noun.person); vocabulary labels are rarely people
+PERSON_LEXFILE = 18
+
+# ImageNet labels stored under their imagenet-simple-labels name rather than the class description
+IMAGENET_LABEL_WNIDS = {
+    "smooth newt": "n01630670",  # common newt
+    "carolina anole": "n01682714",  # American chameleon
+    "desert grassland whiptail lizard": "n01685808",  # whiptail
+    "frilled-necked lizard": "n01688243",  # frilled lizard
+    "eastern hog-nosed snake": "n01729322",  # hognose snake
+    "smooth green snake": "n01729977",  # green snake
+    "saharan horned viper": "n01753488",  # horned viper
+    "eastern diamondback rattlesnake": "n01755581",  # diamondback
+    "southern black widow": "n01774384",  # black widow
+    "bluetick coonhound": "n02088632",  # bluetick
+    "treeing walker coonhound": "n02089867",  # Walker hound
+    "wire fox terrier": "n02095314",  # wire-haired fox terrier
+    "australian silky terrier": "n02097658",  # silky terrier
+    "cocker spaniels": "n02102318",  # cocker spaniel
+    "australian kelpie": "n02105412",  # kelpie
+    "dobermann": "n02107142",  # Doberman
+    "st. bernard": "n02109525",  # Saint Bernard
+    "leonberger": "n02111129",  # Leonberg
+    "pyrenean mountain dog": "n02111500",  # Great Pyrenees
+    "griffon bruxellois": "n02112706",  # Brabancon griffon
+    "alaskan tundra wolf": "n02114548",  # white wolf
+    "longhorn beetle": "n02168699",  # long-horned beetle
+    "small white": "n02280649",  # cabbage butterfly
+    "gossamer-winged butterfly": "n02281787",  # lycaenid
+    "alpine ibex": "n02417914",  # ibex
+    "black-and-white colobus": "n02488702",  # colobus
+    "white-headed capuchin": "n02492035",  # capuchin
+    "geoffroy's spider monkey": "n02493793",  # spider monkey
+    "asian elephant": "n02504013",  # Indian elephant
+    "clownfish": "n02607072",  # anemone fish
+    "waste container": "n02747177",  # ashcan
+    "ring binder": "n02840245",  # binder
+    "high-speed train": "n02917067",  # bullet train
+    "clogs": "n03047690",  # clog
+    "coffeemaker": "n03063689",  # coffeepot
+    "infant bed": "n03131574",  # crib
+    "rotary dial telephone": "n03187595",  # dial telephone
+    "barrette": "n03476684",  # hair slide
+    "hoop skirt": "n03534580",  # hoopskirt
+    "horse-drawn vehicle": "n03538406",  # horse cart
+    "clothes iron": "n03584829",  # iron
+    "jeans": "n03594734",  # jean
+    "pulled rickshaw": "n03599486",  # jinrikisha
+    "slip-on shoe": "n03680355",  # Loafer
+    "tights": "n03710637",  # maillot
+    "swimsuit": "n03710721",  # maillot, tank suit
+    "square academic cap": "n03787032",  # mortarboard
+    "bullock cart": "n03868242",  # oxcart
+    "pajamas": "n03877472",  # pajama
+    "pan flute": "n03884397",  # panpipe
+    "payphone": "n03902125",  # pay-phone
+    "hand plane": "n03954731",  # plane
+    "weighing scale": "n04141975",  # scale
+    "motorboat": "n04273569",  # speedboat
+    "through arch bridge": "n04311004",  # steel arch bridge
+    "scarf": "n04325704",  # stole
+    "front curtain": "n04418357",  # theater curtain
+    "toy store": "n04462240",  # toyshop
+    "semi-trailer truck": "n04467665",  # trailer truck
+    "military aircraft": "n04552348",  # warplane
+    "sink": "n04553703",  # washbasin
+    "split-rail fence": "n04604644",  # worm fence
+    "shipwreck": "n04606251",  # wreck
+    "baguette": "n07684084",  # French loaf
+    "shoal": "n09421951",  # sandbar
+}
+
+# COCO labels from the YOLO model; their most frequent WordNet sense is often the wrong object
+YOLO_LABEL_WNIDS = {
+    "person": "n00007846",
+    "bicycle": "n02834778",
+    "car": "n02958343",
+    "motorcycle": "n03790512",
+    "airplane": "n02691156",
+    "bus": "n02924116",
+    "train": "n04468005",
+    "truck": "n04490091",
+    "boat": "n02858304",
+    "traffic light": "n06874185",
+    "fire hydrant": "n03346898",
+    "stop sign": "n06794110",  # street sign
+    "parking meter": "n03891332",
+    "bench": "n02828884",
+    "bird": "n01503061",
+    "cat": "n02121620",
+    "dog": "n02084071",
+    "horse": "n02374451",
+    "sheep": "n02411705",
+    "cow": "n02403454",
+    "elephant": "n02503517",
+    "bear": "n02131653",
+    "zebra": "n02391049",
+    "giraffe": "n02439033",
+    "backpack": "n02769748",
+    "umbrella": "n04507155",
+    "handbag": "n02774152",
+    "tie": "n03815615",  # necktie
+    "suitcase": "n02773838",
+    "frisbee": "n03397947",
+    "skis": "n04228054",  # ski
+    "snowboard": "n04251791",
+    "sports ball": "n02778669",  # ball
+    "kite": "n03621473",  # the toy, not the hawk or the bad check
+    "baseball bat": "n02799175",
+    "baseball glove": "n02800213",
+    "skateboard": "n04225987",
+    "surfboard": "n04363559",
+    "tennis racket": "n04409806",
+    "bottle": "n02876657",
+    "wine glass": "n04592099",  # wineglass
+    "cup": "n03147509",
+    "fork": "n03383948",
+    "knife": "n03623556",
+    "spoon": "n04284002",
+    "bowl": "n02881193",
+    "banana": "n07753592",  # the fruit, not the plant
+    "apple": "n07739125",
+    "sandwich": "n07695965",
+    "orange": "n07747607",
+    "broccoli": "n07714990",  # the vegetable, not the plant
+    "carrot": "n07730207",  # the vegetable, not the plant
+    "hot dog": "n07697537",
+    "pizza": "n07873807",
+    "donut": "n07639069",
+    "cake": "n07628870",  # baked goods, not a bar of soap
+    "chair": "n03001627",
+    "couch": "n04256520",
+    "potted plant": "n11536230",  # pot plant
+    "bed": "n02818832",
+    "dining table": "n03201208",
+    "toilet": "n04446521",  # the fixture, not the room
+    "tv": "n04405907",  # television receiver, not broadcasting
+    "laptop": "n03642806",
+    "mouse": "n03793489",  # computer mouse, not the rodent
+    "remote": "n04074963",
+    "keyboard": "n03085013",  # computer keyboard
+    "cell phone": "n02992529",
+    "microwave": "n03761084",  # microwave oven, not the wave
+    "oven": "n03862676",
+    "toaster": "n04442312",
+    "sink": "n04223580",
+    "refrigerator": "n04070727",
+    "book": "n02870092",  # the bound object, not the written work
+    "clock": "n03046257",
+    "vase": "n04522168",
+    "scissors": "n04148054",
+    "teddy bear": "n04399382",
+    "hair drier": "n03483316",
+    "toothbrush": "n04453156",
+}
+
+
+def normalize_term(term):
+    """Normalize a label term or WordNet lemma for comparison."""
+    return " ".join(term.replace("_", " ").lower().split())
+
+
+def match_key(term):
+    """Looser key for matching, so "payphone", "pay-phone" and "pay phone" agree."""
+    return "".join(c for c in normalize_term(term) if c not in " -'.")
+
+
+def split_terms(english):
+    """Split an ImageNet style label ("mouse, computer mouse") into its terms."""
+    return [normalize_term(t) for t in english.split(",") if t.strip()]
+
+
+def load_labels(filenames):
+    """Load the English labels from one or more translation files, in order."""
+    labels = []
+    seen = set()
+    for filename in filenames:
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Error loading {filename}: {e}")
+            continue
+
+        for entry in data.get("objects", []):
+            english = entry["english"]
+            if english not in seen:
+                seen.add(english)
+                labels.append(english)
+    return labels
+
+
+def parse_wordnet_data(filename):
+    """Parse a WordNet `data.noun` file into {wnid: {"lemmas", "hypernyms", ...}}."""
+    synsets = {}
+    with open(filename, 'r', encoding='utf-8') as f:
+        for line in f:
+            # The license header lines start with two spaces
+            if line.startswith("  "):
+                continue
+
+            fields = line.split(" | ")[0].split()
+            offset = fields[0]
+            word_count = int(fields[3], 16)
+            lemmas = [fields[4 + 2 * i].replace("_", " ") for i in range(word_count)]
+
+            pos = 4 + 2 * word_count
+            pointer_count = int(fields[pos])
+            hypernyms = []
+            symbols = set()
+            for i in range(pointer_count):
+                symbol, target, target_pos = fields[pos + 1 + 4 * i:pos + 4 + 4 * i]
+                if symbol in HYPERNYM_POINTERS and target_pos == "n":
+                    hypernyms.append(f"n{target}")
+                    symbols.add(symbol)
+
+            synsets[f"n{offset}"] = {
+                "lemmas": lemmas,
+                "hypernyms": hypernyms,
+                "lexfile": int(fields[1]),
+                # Instances are proper names, e.g. Hart Crane for "crane"
+                "instance": symbols == {"@i"},
+            }
+    return synsets
+
+
+def parse_wordnet_index(filename):
+    """Parse a WordNet `index.noun` file into {lemma: [wnids by sense frequency]}."""
+    senses = {}
+    with open(filename, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.startswith("  "):
+                continue
+
+            fields = line.split()
+            synset_count = int(fields[2])
+            offsets = fields[-synset_count:]
+            senses[normalize_term(fields[0])] = [f"n{offset}" for offset in offsets]
+    return senses
+
+
+def load_imagenet_classes(filename):
+    """Load the ImageNet classes as [(wnid, description)], one "wnid description" line per class."""
+    classes = []
+    with open(filename, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                wnid, description = line.rstrip("\n").split(" ", 1)
+                classes.append((wnid, description))
+    return classes
+
+
+class ImageNetClasses:
+    """Resolve ImageNet labels to their class wnids."""
+
+    def __init__(self, classes):
+        # Descriptions are not unique: "crane" is both the bird and the machine
+        self.by_description = {}
+        self.by_term = {}
+        for wnid, description in classes:
+            key = tuple(match_key(term) for term in split_terms(description))
+            self.by_description.setdefault(key, []).append(wnid)
+            for term in split_terms(description):
+                self.by_term.setdefault(match_key(term), set()).add(wnid)
+
+    def resolve(self, english):
+        """Return (wnids, method) for a label, or ([], None) if it isn't an ImageNet class."""
+        terms = split_terms(english)
+        if not terms:
+            return [], None
+
+        wnids = self.by_description.get(tuple(match_key(term) for term in terms))
+        if wnids:
+            return wnids, "imagenet class"
+
+        wnid = IMAGENET_LABEL_WNIDS.get(normalize_term(english))
+        if wnid:
+            return [wnid], "simple label"
+
+        # Descriptions that were truncated or respelled ("bell-cot", "mail bag"), if the term is unambiguous
+        wnids = self.by_term.get(match_key(terms[0]), set())
+        if len(wnids) == 1:
+            return sorted(wnids), "imagenet term"
+        return [], None
+
+
+class WordNetLookup:
+    """Resolve labels to noun synsets using a (possibly partial) WordNet."""
+
+    def __init__(self, synsets, senses):
+        self.synsets = synsets
+
+        # Exact matches on the full lemma list, e.g. "tench, Tinca tinca"
+        self.by_lemmas = {}
+        for wnid, synset in synsets.items():
+            key = tuple(match_key(lemma) for lemma in synset["lemmas"])
+            self.by_lemmas.setdefault(key, wnid)
+
+        self.senses = {}
+        for term, wnids in senses.items():
+            self.senses.setdefault(match_key(term), []).extend(wnids)
+
+    def _is_preferred(self, wnid):
+        synset = self.synsets[wnid]
+        return not synset["instance"] and synset["lexfile"] != PERSON_LEXFILE
+
+    def _first_sense(self, term):
+        key = match_key(term)
+        # Plural labels ("skis", "pajamas") are listed under their singular
+        for candidate in (key, key[:-1] if key.endswith("s") else None):
+            wnids = [wnid for wnid in self.senses.get(candidate, []) if wnid in self.synsets]
+            if wnids:
+                # Most frequent sense, skipping people unless nothing else fits
+                return next((wnid for wnid in wnids if self._is_preferred(wnid)), wnids[0])
+        return None
+
+    def resolve(self, english):
+        """Return (wnid, method) for a label, or (None, None) if it can't be mapped."""
+        terms = split_terms(english)
+        if not terms:
+            return None, None
+
+        # A single term is ambiguous ("dog", "person"), so only trust full lemma lists
+        if len(terms) > 1:
+            wnid = self.by_lemmas.get(tuple(match_key(term) for term in terms))
+            if wnid:
+                return wnid, "lemmas"
+
+        # Fall back to the most frequent sense of any listed term
+        for term in terms:
+            wnid = self._first_sense(term)
+            if wnid:
+                return wnid, "first sense"
+
+        # Finally drop modifiers from the main term ("southern black widow" -> "black widow")
+        words = terms[0].split()
+        for start in range(1, len(words)):
+            wnid = self._first_sense(" ".join(words[start:]))
+            if wnid:
+                return wnid, "modifier dropped"
+        return None, None
+
+    def ancestors(self, wnid):
+        """Return wnid and all of its hypernyms (transitively)."""
+        closure = {wnid}
+        queue = deque([wnid])
+        while queue:
+            for parent in self.synsets[queue.popleft()]["hypernyms"]:
+                if parent in self.synsets and parent not in closure:
+                    closure.add(parent)
+                    queue.append(parent)
+        return closure
+
+
+# How each label was mapped; the guessed ones are listed after every build
+GUESSED_METHODS = ["imagenet term", "first sense", "modifier dropped"]
+
+
+def map_labels(imagenet_files, yolo_files, classes, lookup):
+    """
+    Map the labels of every translation file to synsets.
+    Returns the labels, their wnids (a label can name several synsets, e.g. the
+    ImageNet "kite" bird and the YOLO "kite" toy) and how each label was mapped.
+    """
+    labels = []
+    leaves = {}
+    methods = {}
+    for kind, filenames in [("imagenet", imagenet_files), ("yolo", yolo_files)]:
+        for english in load_labels(filenames):
+            if kind == "imagenet":
+                wnids, method = classes.resolve(english)
+            else:
+                wnid = YOLO_LABEL_WNIDS.get(normalize_term(english))
+                wnids, method = ([wnid], "yolo label") if wnid else ([], None)
+
+            if not wnids:
+                wnid, method = lookup.resolve(english)
+                wnids = [wnid] if wnid else []
+
+            if english not in leaves:
+                labels.append(english)
+                leaves[english] = []
+                methods[english] = []
+            leaves[english].extend(wnid for wnid in wnids if wnid not in leaves[english])
+            if method:
+                methods[english].append(method)
+
+    return labels, [leaves[english] for english in labels], [methods[english] for english in labels]
+
+
+def load_wordnet(wordnet_dir):
+    """Load a full WordNet 3.0 noun database in the snapshot format."""
+    license_path = os.path.join(wordnet_dir, "LICENSE")
+    license_text = ""
+    if os.path.exists(license_path):
+        with open(license_path, 'r', encoding='utf-8') as f:
+            license_text = f.read().strip()
+
+    return {
+        "source": "WordNet 3.0",
+        "license": license_text,
+        "synsets": parse_wordnet_data(os.path.join(wordnet_dir, "data.noun")),
+        "senses": parse_wordnet_index(os.path.join(wordnet_dir, "index.noun")),
+    }
+
+
+def build_snapshot(wordnet, leaves):
+    """Keep only the synsets reachable from the labels' wnids."""
+    lookup = WordNetLookup(wordnet["synsets"], wordnet["senses"])
+
+    keep = set()
+    for wnids in leaves:
+        for wnid in wnids:
+            if wnid in lookup.synsets:
+                keep |= lookup.ancestors(wnid)
+
+    kept_synsets = {wnid: wordnet["synsets"][wnid] for wnid in sorted(keep)}
+
+    # Only keep senses that point into the snapshot, in their original order
+    kept_senses = {}
+    for term, wnids in wordnet["senses"].items():
+        kept = [wnid for wnid in wnids if wnid in keep]
+        if kept:
+            kept_senses[term] = kept
+
+    return {
+        "source": wordnet["source"],
+        "license": wordnet["license"],
+        "synsets": kept_synsets,
+        "senses": kept_senses,
+    }
+
+
+def load_snapshot(filename):
+    """Load the vendored WordNet snapshot."""
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_json(data, filename, indent=None):
+    """Save data as UTF-8 JSON."""
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False, separators=(",", ":") if indent is None else None)
+
+
+def build_category_index(labels, leaves, snapshot):
+    """
+    Precompute each category's label closure from the labels' wnids.
+    Returns the index and the labels that could not be mapped.
+    """
+    synsets = snapshot["synsets"]
+    lookup = WordNetLookup(synsets, snapshot["senses"])
+
+    index_leaves = []
+    members = {}
+    unmapped = []
+    for i, (english, wnids) in enumerate(zip(labels, leaves)):
+        # wnids missing from the snapshot mean it needs a refresh with --wordnet-dir
+        wnids = [wnid for wnid in wnids if wnid in synsets]
+        index_leaves.append(wnids)
+        if not wnids:
+            unmapped.append(english)
+            continue
+        closure = set()
+        for wnid in wnids:
+            closure |= lookup.ancestors(wnid)
+        for ancestor in closure:
+            members.setdefault(ancestor, []).append(i)
+
+    depths = {}
+
+    def depth(wnid):
+        if wnid not in depths:
+            parents = [p for p in synsets[wnid]["hypernyms"] if p in synsets]
+            depths[wnid] = 1 + min(depth(p) for p in parents) if parents else 0
+        return depths[wnid]
+
+    categories = {}
+    names = {}
+    for wnid in sorted(members):
+        synset = synsets[wnid]
+        categories[wnid] = {
+            "name": synset["lemmas"][0],
+            "parents": [p for p in synset["hypernyms"] if p in members],
+            "depth": depth(wnid),
+            "labels": members[wnid],
+        }
+        for lemma in synset["lemmas"]:
+            names.setdefault(normalize_term(lemma), []).append(wnid)
+
+    index = {
+        "source": snapshot.get("source", "WordNet"),
+        "labels": labels,
+        "leaves": index_leaves,
+        "categories": categories,
+        "names": names,
+    }
+    return index, unmapped
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build a WordNet category index for the translation labels.")
+    parser.add_argument("--imagenet", nargs="*", default=DEFAULT_IMAGENET_SOURCES,
+                        help="Translation JSON files with ImageNet labels")
+    parser.add_argument("--yolo", nargs="*", default=DEFAULT_YOLO_SOURCES,
+                        help="Translation JSON files with YOLO (COCO) labels")
+    parser.add_argument("--classes", default=DEFAULT_CLASSES, help="ImageNet class wnids, in class order")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Where to write the category index")
+    parser.add_argument("--snapshot", default=DEFAULT_SNAPSHOT, help="Vendored WordNet snapshot")
+    parser.add_argument("--wordnet-dir", help="Refresh the snapshot from this WordNet 3.0 database directory first")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if args.wordnet_dir:
+        print(f"Loading WordNet from {args.wordnet_dir}...")
+        wordnet = load_wordnet(args.wordnet_dir)
+    else:
+        wordnet = load_snapshot(args.snapshot)
+
+    classes = ImageNetClasses(load_imagenet_classes(args.classes))
+    lookup = WordNetLookup(wordnet["synsets"], wordnet["senses"])
+    labels, leaves, methods = map_labels(args.imagenet, args.yolo, classes, lookup)
+    if not labels:
+        print("No labels found. Exiting.")
+        return
+    print(f"Loaded {len(labels)} labels from {len(args.imagenet) + len(args.yolo)} file(s)")
+
+    if args.wordnet_dir:
+        snapshot = build_snapshot(wordnet, leaves)
+        save_json(snapshot, args.snapshot, indent=1)
+        print(f"Saved {len(snapshot['synsets'])} synsets to {args.snapshot}")
+    else:
+        snapshot = wordnet
+
+    index, unmapped = build_category_index(labels, leaves, snapshot)
+    save_json(index, args.output)
+
+    print(f"Mapped {len(labels) - len(unmapped)} labels into {len(index['categories'])} categories")
+    for method in GUESSED_METHODS:
+        guessed = [(english, wnids) for english, wnids, label_methods in zip(labels, index["leaves"], methods)
+                   if method in label_methods]
+        if guessed:
+            print(f"Check {len(guessed)} labels mapped by {method}:")
+            for english, wnids in guessed:
+                lemmas = "; ".join(", ".join(snapshot["synsets"][wnid]["lemmas"]) for wnid in wnids)
+                print(f"  {english} -> {lemmas}")
+    if unmapped:
+        print(f"Warning: {len(unmapped)} labels have no WordNet synset:")
+        for english in unmapped:
+            print(f"  {english}")
+    print(f"Saved category index to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
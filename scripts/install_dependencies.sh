@@ -1,11 +1,13 @@
 #!/bin/bash
 
-# Install required Python packages
-echo "Installing required Python packages..."
-pip install requests beautifulsoup4 openai
+SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"
+
+# Install the pipeline and its optional dependencies
+echo "Installing the tono-pipeline command and required Python packages..."
+pip install -e "$SCRIPT_DIR[all]"
 
 echo "Dependencies installed successfully!"
-echo "You can now run the scripts in the following order:"
-echo "1. python extract_imagenet_labels.py"
-echo "2. python translate_labels.py"
-echo "3. python merge_translations.py" 
\ No newline at end of file
+echo "You can now run the pipeline in the following order:"
+echo "1. tono-pipeline extract"
+echo "2. tono-pipeline translate"
+echo "3. tono-pipeline merge translated_labels.json"
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Spaced-repetition simulator for tuning the review scheduler.
+
+Reimplements the interval policy from PersistenceController.updateReviewStatus
+(1 day, then 6 days, then a growing factor capped at 60 days, reset to 1 day on
+failure) next to SM-2 and an FSRS-style scheduler, and runs them against a
+simulated population of learners. Every learner x item pair is one cell in a
+flat NumPy array, so a million review histories are advanced one day at a time
+with vectorized operations instead of per-object Python loops.
+
+The "true" memory of each cell follows an exponential forgetting curve whose
+stability grows after successful reviews (more when the review was harder) and
+shrinks after lapses. Learner ability and item difficulty scale the growth.
+The schedulers only ever see pass/fail outcomes, just like the app.
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+# FSRS-4.5 default weights
+FSRS_WEIGHTS = [
+    0.4872, 1.4003, 3.7145, 13.8206, 5.1618, 1.2298, 0.8975, 0.031, 1.6474,
+    0.1367, 1.0461, 2.1072, 0.0793, 0.3246, 1.587, 0.2272, 2.8755,
+]
+FSRS_DECAY = -0.5
+FSRS_FACTOR = 19 / 81
+
+AGAIN = 1
+GOOD = 3
+
+
+class TonoPolicy:
+    """The interval policy shipped in PersistenceController.updateReviewStatus."""
+
+    name = "tono"
+
+    def __init__(self, size, max_interval=60):
+        self.max_interval = max_interval
+        self.interval = np.zeros(size, dtype=np.int32)
+        self.review_count = np.zeros(size, dtype=np.int32)
+        self.success_count = np.zeros(size, dtype=np.int32)
+
+    def review(self, idx, correct, elapsed):
+        """Update state for the cells in idx and return their next intervals."""
+        interval = self.interval[idx]
+        review_count = self.review_count[idx]
+        success_count = self.success_count[idx]
+
+        success_count = np.where(correct, success_count + 1, 0)
+
+        # Mirrors the Int32(Double(interval) * factor) truncation in Swift
+        factor = np.minimum(2.5, 1.3 + success_count * 0.1)
+        grown = np.minimum(self.max_interval, (interval * factor).astype(np.int32))
+        grown = np.where(review_count == 0, 1, np.where(review_count == 1, 6, grown))
+
+        interval = np.where(correct, grown, 1).astype(np.int32)
+        # A failed review does not advance the review count
+        review_count = review_count + correct
+
+        self.interval[idx] = interval
+        self.review_count[idx] = review_count
+        self.success_count[idx] = success_count
+        return interval
+
+
+class SM2Policy:
+    """Classic SuperMemo-2 with a pass mapped to grade 4; a failure restarts repetitions."""
+
+    name = "sm2"
+
+    def __init__(self, size, max_interval=None):
+        self.max_interval = max_interval
+        self.interval = np.zeros(size, dtype=np.int32)
+        self.repetitions = np.zeros(size, dtype=np.int32)
+        self.ease = np.full(size, 2.5, dtype=np.float32)
+
+    def review(self, idx, correct, elapsed):
+        """Update state for the cells in idx and return their next intervals."""
+        interval = self.interval[idx]
+        repetitions = self.repetitions[idx]
+        ease = self.ease[idx]
+
+        # EF' = EF + (0.1 - (5 - q) * (0.08 + (5 - q) * 0.02)) is only applied to passes (q = 4,
+        # a change of 0); classic SM-2 restarts repetitions on failure without touching the E-Factor
+        quality = 4
+        ease_change = 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
+        ease = np.where(correct, np.maximum(1.3, ease + ease_change), ease).astype(np.float32)
+
+        grown = np.rint(interval * ease).astype(np.int32)
+        grown = np.where(repetitions == 0, 1, np.where(repetitions == 1, 6, grown))
+        if self.max_interval:
+            grown = np.minimum(self.max_interval, grown)
+
+        interval = np.where(correct, grown, 1).astype(np.int32)
+        repetitions = np.where(correct, repetitions + 1, 0)
+
+        self.interval[idx] = interval
+        self.repetitions[idx] = repetitions
+        self.ease[idx] = ease
+        return interval
+
+
+class FSRSPolicy:
+    """FSRS-style scheduler targeting a fixed desired retention."""
+
+    name = "fsrs"
+
+    def __init__(self, size, max_interval=None, desired_retention=0.9, weights=FSRS_WEIGHTS):
+        self.max_interval = max_interval
+        self.desired_retention = desired_retention
+        self.w = weights
+        self.stability = np.zeros(size, dtype=np.float32)
+        self.difficulty = np.zeros(size, dtype=np.float32)
+
+    def _initial_difficulty(self, grade):
+        return self.w[4] - (grade - 3) * self.w[5]
+
+    def review(self, idx, correct, elapsed):
+        """Update state for the cells in idx and return their next intervals."""
+        w = self.w
+        stability = self.stability[idx]
+        difficulty = self.difficulty[idx]
+        grade = np.where(correct, GOOD, AGAIN)
+        first = stability == 0
+
+        # Predicted retrievability at review time; unused for first reviews
+        safe_stability = np.where(first, 1.0, stability)
+        retrievability = (1 + FSRS_FACTOR * elapsed / safe_stability) ** FSRS_DECAY
+
+        recall_stability = safe_stability * (
+            1
+            + np.exp(w[8])
+            * (11 - difficulty)
+            * safe_stability ** -w[9]
+            * (np.exp(w[10] * (1 - retrievability)) - 1)
+        )
+        forget_stability = (
+            w[11]
+            * np.maximum(difficulty, 1) ** -w[12]
+            * ((safe_stability + 1) ** w[13] - 1)
+            * np.exp(w[14] * (1 - retrievability))
+        )
+        new_stability = np.where(correct, recall_stability, np.minimum(forget_stability, safe_stability))
+        new_stability = np.where(first, np.where(correct, w[GOOD - 1], w[AGAIN - 1]), new_stability)
+
+        next_difficulty = difficulty - w[6] * (grade - 3)
+        next_difficulty = w[7] * self._initial_difficulty(3) + (1 - w[7]) * next_difficulty
+        new_difficulty = np.where(first, self._initial_difficulty(grade), next_difficulty)
+        new_difficulty = np.clip(new_difficulty, 1, 10)
+
+        interval = new_stability / FSRS_FACTOR * (self.desired_retention ** (1 / FSRS_DECAY) - 1)
+        interval = np.maximum(1, np.rint(interval)).astype(np.int32)
+        if self.max_interval:
+            interval = np.minimum(self.max_interval, interval)
+
+        self.stability[idx] = new_stability
+        self.difficulty[idx] = new_difficulty
+        return interval
+
+
+POLICIES = {
+    "tono": TonoPolicy,
+    "sm2": SM2Policy,
+    "fsrs": FSRSPolicy,
+}
+
+
+def simulate(policy_name, learners=1000, items=1000, days=365, ramp_days=30,
+             initial_stability=1.0, growth=9.0, lapse_factor=0.3,
+             max_interval=None, desired_retention=0.9, sample_every=7, seed=0):
+    """
+    Simulate every learner x item review history under one policy.
+    Returns a dictionary of retention and workload metrics.
+    """
+    if days <= ramp_days:
+        raise ValueError("days must be greater than ramp_days")
+
+    rng = np.random.default_rng(seed)
+    size = learners * items
+
+    # Per-cell memory scale from learner ability and item difficulty
+    ability = rng.lognormal(0.0, 0.3, learners).astype(np.float32)
+    easiness = rng.lognormal(0.0, 0.3, items).astype(np.float32)
+    aptitude = np.outer(ability, easiness).ravel()
+
+    # Objects are tagged at a random day during the ramp and first reviewed the next day
+    learned_day = rng.integers(0, max(1, ramp_days), size, dtype=np.int32)
+    last_review = learned_day.copy()
+    due_day = learned_day + 1
+    stability = (initial_stability * aptitude).astype(np.float32)
+
+    kwargs = {}
+    if max_interval is not None:
+        kwargs["max_interval"] = max_interval
+    if policy_name == "fsrs":
+        kwargs["desired_retention"] = desired_retention
+    policy = POLICIES[policy_name](size, **kwargs)
+
+    total_reviews = 0
+    total_correct = 0
+    retention_samples = []
+    start = time.perf_counter()
+
+    for day in range(days):
+        idx = np.flatnonzero(due_day == day)
+        if idx.size:
+            elapsed = (day - last_review[idx]).astype(np.float32)
+            cell_stability = stability[idx]
+            recall_probability = np.exp(-elapsed / cell_stability)
+            correct = rng.random(idx.size, dtype=np.float32) < recall_probability
+
+            # Harder successful reviews (lower recall probability) grow memory more
+            gain = 1 + growth * aptitude[idx] * (np.exp(1 - recall_probability) - 1)
+            stability[idx] = np.where(
+                correct,
+                cell_stability * gain,
+                np.maximum(0.5, cell_stability * lapse_factor),
+            )
+            last_review[idx] = day
+
+            interval = policy.review(idx, correct, elapsed)
+            due_day[idx] = day + interval
+
+            total_reviews += idx.size
+            total_correct += int(correct.sum())
+
+        if day >= ramp_days and (day - ramp_days) % sample_every == 0:
+            retention = np.exp(-(day - last_review) / stability)
+            retention_samples.append(float(retention.mean()))
+
+    final_retention = float(np.exp(-(days - last_review) / stability).mean())
+    elapsed_seconds = time.perf_counter() - start
+
+    return {
+        "policy": policy_name,
+        "cells": size,
+        "days": days,
+        "reviews": total_reviews,
+        "reviews_per_learner_day": total_reviews / (learners * days),
+        "review_accuracy": total_correct / total_reviews if total_reviews else 0.0,
+        "mean_retention": float(np.mean(retention_samples)) if retention_samples else final_retention,
+        "final_retention": final_retention,
+        "retention_per_review": final_retention * size / total_reviews if total_reviews else 0.0,
+        "seconds": elapsed_seconds,
+    }
+
+
+def print_report(results):
+    """Print a retention versus review load table."""
+    header = (
+        f"{'policy':<8} {'reviews/day':>12} {'accuracy':>9} {'mean ret.':>10} {'final ret.':>11} "
+        f"{'ret./review':>12} {'seconds':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['policy']:<8} {r['reviews_per_learner_day']:>12.2f} {r['review_accuracy']:>9.3f} "
+            f"{r['mean_retention']:>10.3f} {r['final_retention']:>11.3f} "
+            f"{r['retention_per_review']:>12.4f} {r['seconds']:>8.2f}"
+        )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compare review scheduling policies on simulated learners.")
+    parser.add_argument("--policies", nargs="+", choices=sorted(POLICIES), default=["tono", "sm2", "fsrs"])
+    parser.add_argument("--learners", type=int, default=1000)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--ramp-days", type=int, default=30, help="Days over which new objects are tagged")
+    parser.add_argument("--initial-stability", type=float, default=1.0, help="Memory stability (days) after tagging")
+    parser.add_argument("--growth", type=float, default=9.0, help="Stability growth scale on successful recall")
+    parser.add_argument("--lapse-factor", type=float, default=0.3, help="Stability multiplier on failed recall")
+    parser.add_argument("--max-interval", type=int, default=None, help="Override each policy's interval cap")
+    parser.add_argument("--desired-retention", type=float, default=0.9, help="Target retention for FSRS")
+    parser.add_argument("--sample-every", type=int, default=7, help="Days between retention samples")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+    # Objects tagged on or after the last day are never reviewed, so retention would be meaningless
+    if args.days <= args.ramp_days:
+        parser.error("--days must be greater than --ramp-days")
+    return args
+
+
+def main():
+    args = parse_args()
+    print(f"Simulating {args.learners * args.items:,} review histories over {args.days} days...")
+
+    results = []
+    for name in args.policies:
+        results.append(simulate(
+            name,
+            learners=args.learners,
+            items=args.items,
+            days=args.days,
+            ramp_days=args.ramp_days,
+            initial_stability=args.initial_stability,
+            growth=args.growth,
+            lapse_factor=args.lapse_factor,
+            max_interval=args.max_interval,
+            desired_retention=args.desired_retention,
+            sample_every=args.sample_every,
+            seed=args.seed,
+        ))
+
+    print_report(results)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved results to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from tono_pipeline.common import canonicalize_term
+from tono_pipeline.singleflight import SingleFlight, TranslationRegistry, group_by_term
+from tono_pipeline.translate import translate_labels
+
+
+def wait_for(condition, timeout=5):
+    """Poll until condition() is true, so tests don't depend on thread scheduling."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out waiting for condition")
+        time.sleep(0.001)
+
+
+class SingleFlightTest(unittest.TestCase):
+    def run_concurrently(self, flight, fn, callers=5):
+        """Call flight.do("key", fn) from several threads while fn blocks, and collect the outcomes."""
+        outcomes = [None] * callers
+
+        def call(i):
+            try:
+                outcomes[i] = ("result", flight.do("key", fn))
+            except Exception as e:
+                outcomes[i] = ("error", e)
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(callers)]
+        for thread in threads:
+            thread.start()
+        wait_for(lambda: flight.stats["calls"] == callers)
+        return threads, outcomes
+
+    def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            release.wait(5)
+            return ("苹果", "píng guǒ")
+
+        threads, outcomes = self.run_concurrently(flight, fn)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.stats["coalesced"], 4)
+        self.assertEqual(outcomes, [("result", ("苹果", "píng guǒ"))] * 5)
+        self.assertEqual(flight.do("key", fn), ("苹果", "píng guǒ"))
+        self.assertEqual(len(calls), 1)
+
+    def test_failures_are_not_cached(self):
+        flight = SingleFlight()
+        results = iter([None, ("书", "shū")])
+
+        self.assertIsNone(flight.do("key", lambda: next(results)))
+        self.assertIsNone(flight.get("key"))
+        self.assertEqual(flight.do("key", lambda: next(results)), ("书", "shū"))
+        self.assertEqual(flight.stats["executed"], 2)
+
+    def test_exception_reaches_all_waiters(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fn():
+            release.wait(5)
+            raise RuntimeError("rate limited")
+
+        threads, outcomes = self.run_concurrently(flight, fn)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([kind for kind, _ in outcomes], ["error"] * 5)
+        self.assertTrue(all(str(error) == "rate limited" for _, error in outcomes))
+        # The failed call is not cached, so the next caller retries
+        self.assertEqual(flight.do("key", lambda: ("书", "shū")), ("书", "shū"))
+
+
+class CanonicalizeTermTest(unittest.TestCase):
+    def test_case_spacing_and_synonyms(self):
+        self.assertEqual(canonicalize_term("Mouse"), canonicalize_term(" mouse "))
+        self.assertEqual(canonicalize_term("hot_dog"), "hot dog")
+        self.assertEqual(canonicalize_term("sofa"), canonicalize_term("couch"))
+        self.assertEqual(canonicalize_term("TV, television"), "tv")
+
+    def test_keeps_every_term(self):
+        self.assertEqual(canonicalize_term("cardigan, Cardigan Welsh corgi"), "cardigan, cardigan welsh corgi")
+        self.assertNotEqual(canonicalize_term("cardigan"), canonicalize_term("cardigan, Cardigan Welsh corgi"))
+
+
+class GroupByTermTest(unittest.TestCase):
+    def test_bare_term_joins_label_for_the_same_noun(self):
+        groups = group_by_term(["mouse", "Mouse, computer mouse"])
+        self.assertEqual(groups, {"mouse, computer mouse": ["Mouse, computer mouse", "mouse"]})
+
+    def test_different_concepts_stay_separate(self):
+        groups = group_by_term(["cardigan", "cardigan, Cardigan Welsh corgi"])
+        self.assertEqual(list(groups.values()), [["cardigan"], ["cardigan, Cardigan Welsh corgi"]])
+
+
+class TranslationRegistryTest(unittest.TestCase):
+    def setUp(self):
+        # Requests go through the mocked translate_term_openai; any client counts as configured
+        client = mock.patch("tono_pipeline.singleflight.get_openai", return_value=object())
+        client.start()
+        self.addCleanup(client.stop)
+
+    def test_translate_all_sends_full_labels(self):
+        registry = TranslationRegistry(delay=0)
+        registry.remember("sofa", ("沙发", "shā fā"))
+        labels = ["mouse", "Mouse, computer mouse", "cardigan, Cardigan Welsh corgi", "couch", "Couch"]
+
+        with mock.patch("tono_pipeline.singleflight.translate_term_openai", side_effect=lambda label: (label, "")) as request:
+            translations = registry.translate_all(labels, workers=2)
+
+        sent = sorted(call.args[0] for call in request.call_args_list)
+        self.assertEqual(sent, ["Mouse, computer mouse", "cardigan, Cardigan Welsh corgi"])
+        self.assertEqual(translations["mouse"], ("Mouse, computer mouse", ""))
+        self.assertEqual(translations["Couch"], ("沙发", "shā fā"))
+        self.assertEqual(registry.stats["sent"], 2)
+        self.assertEqual(registry.stats["reused"], 2)
+
+    def test_cache_is_shared_between_forms_of_a_label(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache_path = os.path.join(directory, "translation_cache.json")
+            translate = "tono_pipeline.singleflight.translate_term_openai"
+
+            imagenet = TranslationRegistry(cache_path=cache_path, delay=0)
+            with mock.patch(translate, return_value=("鼠标", "shǔ biāo")):
+                imagenet.translate_all(["mouse, computer mouse", "cardigan, Cardigan Welsh corgi"])
+            imagenet.save()
+
+            yolo = TranslationRegistry(cache_path=cache_path, delay=0)
+            with mock.patch(translate, return_value=("开衫", "kāi shān")) as request:
+                translations = yolo.translate_all(["mouse", "cardigan"])
+
+        # "mouse" reuses the ImageNet result; the corgi doesn't answer for the sweater
+        request.assert_called_once_with("cardigan")
+        self.assertEqual(translations, {"mouse": ("鼠标", "shǔ biāo"), "cardigan": ("开衫", "kāi shān")})
+        self.assertEqual(yolo.stats["reused"], 1)
+
+    def test_translate_labels_counts_each_label_once(self):
+        registry = TranslationRegistry(delay=0)
+        data = {"objects": [
+            {"english": english, "chinese": "", "pinyin": "", "category": ""}
+            for english in ["apple", "book", "Book", "cup", "mouse, computer mouse"]
+        ]}
+        # The batch reply leaves out "mouse, computer mouse", so it goes through the second pass too
+        reply = "apple: 苹果 (píng guǒ)\nbook: 书 (shū)\ncup: 杯子 (bēi zi)"
+        create = mock.Mock(return_value=SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=reply))]
+        ))
+        openai = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+        with mock.patch("tono_pipeline.translate.get_openai", return_value=openai), \
+                mock.patch("tono_pipeline.translate.time.sleep"), \
+                mock.patch("tono_pipeline.singleflight.translate_term_openai", return_value=("鼠标", "shǔ biāo")):
+            translate_labels(data, registry=registry)
+
+        self.assertEqual(registry.stats["labels"], 5)
+        # One batch request and one single request for the label the batch missed
+        self.assertEqual(registry.stats["sent"], 2)
+        self.assertEqual(create.call_count, 1)
+
+    def test_batch_without_client_sends_nothing(self):
+        registry = TranslationRegistry(delay=0)
+        data = {"objects": [{"english": "apple", "chinese": "", "pinyin": "", "category": ""}]}
+
+        with mock.patch("tono_pipeline.translate.get_openai", return_value=None), \
+                mock.patch("tono_pipeline.singleflight.get_openai", return_value=None):
+            translate_labels(data, registry=registry)
+
+        self.assertEqual(registry.stats["labels"], 1)
+        self.assertEqual(registry.stats["sent"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
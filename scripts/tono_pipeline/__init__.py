@@ -0,0 +1,3 @@
+"""Tono vocabulary translation pipeline."""
+
+__version__ = "0.1.0"
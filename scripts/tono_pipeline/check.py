@@ -0,0 +1,44 @@
+"""Find object labels that have no translation yet."""
+from .common import load_translations, save_translations
+
+
+def load_objects(filename):
+    """Load object labels, one per line."""
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            return [line.strip() for line in f if line.strip()]
+    except Exception as e:
+        print(f"Error loading objects file: {e}")
+        return None
+
+
+def find_missing_translations(objects, translation_files):
+    """Return the objects that none of the translation files cover."""
+    known = set()
+    for filename in translation_files:
+        data = load_translations(filename)
+        if data:
+            known.update(entry["english"].lower() for entry in data["objects"])
+
+    return [obj for obj in objects if obj.lower() not in known]
+
+
+def run(args):
+    objects = load_objects(args.objects)
+    if objects is None:
+        return 1
+
+    missing = find_missing_translations(objects, args.translations)
+    print(f"Found {len(missing)} of {len(objects)} objects without translations")
+
+    if missing and args.output:
+        template = {
+            "objects": [
+                {"english": obj.lower(), "chinese": "", "pinyin": "", "category": obj.lower()}
+                for obj in missing
+            ]
+        }
+        save_translations(template, args.output)
+        print(f"Saved missing translations template to {args.output}")
+
+    return 1 if missing else 0
@@ -0,0 +1,99 @@
+"""
+Command line entry point for the translation pipeline.
+
+The parser only uses the standard library. Each subcommand's module is
+imported after argument parsing, and those modules import heavy dependencies
+inside the functions that need them.
+"""
+import argparse
+import importlib
+import sys
+
+from .common import MERGED_TRANSLATIONS_PATH, TRANSLATIONS_PATH, YOLO_TRANSLATIONS_PATH
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="tono-pipeline", description="Tono vocabulary translation pipeline.")
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    subparsers.required = True
+
+    extract = subparsers.add_parser("extract", help="Download ImageNet labels and prepare them for translation")
+    extract.add_argument("--output", default="imagenet_labels_for_translation.json")
+
+    translate = subparsers.add_parser("translate", help="Translate labels to Chinese with pinyin")
+    translate.add_argument("--input", default="imagenet_labels_for_translation.json")
+    translate.add_argument("--output", default="translated_labels.json")
+    translate.add_argument("--cache", help="JSON file of translations shared across runs")
+    translate.add_argument("--workers", type=int, default=1, help="Concurrent translation requests")
+    translate.add_argument(
+        "--method", choices=["openai", "google", "deepl"], default="openai",
+        help="OpenAI (best quality, includes pinyin), Google Translate (no key, limited usage) or DeepL"
+    )
+
+    repair = subparsers.add_parser("repair", help="Fix entries with missing translations using OpenAI")
+    repair.add_argument("--input", default="missing_translations.json")
+    repair.add_argument("--output", default="translated_labels_fixed.json")
+    repair.add_argument("--cache", help="JSON file of translations shared across runs")
+    repair.add_argument("--workers", type=int, default=1, help="Concurrent translation requests")
+
+    validate = subparsers.add_parser("validate", help="Check translation files for missing fields and duplicates")
+    validate.add_argument("files", nargs="*", default=[TRANSLATIONS_PATH, YOLO_TRANSLATIONS_PATH])
+
+    merge = subparsers.add_parser("merge", help="Merge translated labels into the app's translations")
+    merge.add_argument("files", nargs="+", help="Translation files to merge in, in order")
+    merge.add_argument("--base", default=TRANSLATIONS_PATH)
+    merge.add_argument("--output", default=MERGED_TRANSLATIONS_PATH)
+    merge.add_argument("--overwrite", action="store_true", help="Replace existing entries with the same English")
+    merge.add_argument("--include-incomplete", action="store_true", help="Also merge entries without a translation")
+
+    check = subparsers.add_parser("check", help="Find object labels without a translation")
+    check.add_argument("objects", help="Text file with one object label per line")
+    check.add_argument("--translations", nargs="+", default=[TRANSLATIONS_PATH, YOLO_TRANSLATIONS_PATH])
+    check.add_argument("--output", help="Write a JSON template for the missing translations here")
+
+    store = subparsers.add_parser("store", help="Columnar vocabulary store with vectorized QA queries")
+    store.add_argument("--store", default="vocabulary.arrow", help="Store path (.arrow, or .parquet)")
+    store_actions = store.add_subparsers(dest="action", metavar="action")
+    store_actions.required = True
+
+    store_import = store_actions.add_parser("import", help="Import translation JSON files into the store")
+    store_import.add_argument("files", nargs="*", help="Translation files (defaults to all known vocabulary files)")
+
+    store_export = store_actions.add_parser("export", help="Export the store back to the app's JSON schema")
+    store_export.add_argument("--source", nargs=1, help="Only export this source")
+    store_export.add_argument("--output", required=True)
+
+    for name, help_text in [
+        ("summary", "Per-source entry counts and missing fields"),
+        ("missing", "Entries with blank fields"),
+        ("duplicates", "English labels that appear more than once"),
+    ]:
+        action = store_actions.add_parser(name, help=help_text)
+        action.add_argument("--source", nargs="+", help="Only query these sources")
+        action.add_argument("--limit", type=int, default=20, help="Maximum rows to print")
+        if name == "missing":
+            action.add_argument("--fields", nargs="+", default=["chinese", "pinyin"], choices=["english", "chinese", "pinyin", "category"])
+        if name == "duplicates":
+            action.add_argument("--across-sources", action="store_true", help="Count duplicates across all sources")
+
+    store_diff = store_actions.add_parser("diff", help="Compare two sources")
+    store_diff.add_argument("left")
+    store_diff.add_argument("right")
+    store_diff.add_argument("--limit", type=int, default=20, help="Maximum rows to print")
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        command = importlib.import_module(f"{__package__}.{args.command}")
+    except ImportError as e:
+        # Optional dependencies are imported with the command's module
+        print(f"Error: {e}")
+        return 1
+    return command.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+Helpers shared by the pipeline commands.
+
+Only the standard library is imported at module level. Heavy dependencies
+(`openai`, `requests`, `bs4`) are imported inside the functions that use them,
+so quick local commands like validate and merge start instantly.
+"""
+import json
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESOURCES_DIR = os.path.join(SCRIPT_DIR, "..", "Tono", "Resources")
+
+TRANSLATIONS_PATH = os.path.join(RESOURCES_DIR, "translations.json")
+YOLO_TRANSLATIONS_PATH = os.path.join(RESOURCES_DIR, "yolo_translations.json")
+MERGED_TRANSLATIONS_PATH = os.path.join(RESOURCES_DIR, "translations_merged.json")
+
+OPENAI_MODEL = "gpt-3.5-turbo"
+
+
+def load_translations(filename):
+    """Load a translations JSON file ({"objects": [...]})."""
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data
+    except Exception as e:
+        print(f"Error loading file: {e}")
+        return None
+
+
+def save_translations(data, filename):
+    """Save translations to a JSON file in the app's format."""
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def is_missing(entry):
+    """Return True if an entry has no Chinese or pinyin yet."""
+    return not entry.get("chinese") or not entry.get("pinyin")
+
+
+def clean_term_for_translation(term):
+    """Clean a term for translation by extracting the main concept."""
+    # For terms with scientific names or multiple descriptions, focus on the main concept
+    if ',' in term:
+        # Take only the first part before the comma
+        main_term = term.split(',')[0].strip()
+        return main_term
+    return term
+
+
+# Spellings that should share one translation request (mostly YOLO vs ImageNet names)
+TERM_SYNONYMS = {
+    "aeroplane": "airplane",
+    "motorbike": "motorcycle",
+    "sofa": "couch",
+    "television": "tv",
+    "tvmonitor": "tv",
+    "cellphone": "cell phone",
+    "mobile phone": "cell phone",
+    "cellular telephone": "cell phone",
+    "diningtable": "dining table",
+    "pottedplant": "potted plant",
+    "doughnut": "donut",
+    "hair dryer": "hair drier",
+}
+
+
+def canonicalize_term(term):
+    """
+    Normalize a full label for request coalescing, so that "Mouse" and "mouse"
+    or "TV" and "television" share one request. Every comma-separated term is
+    kept: "cardigan" and "cardigan, Cardigan Welsh corgi" stay different.
+    """
+    terms = []
+    for part in term.replace('_', ' ').split(','):
+        part = ' '.join(part.lower().split())
+        part = TERM_SYNONYMS.get(part, part)
+        if part and part not in terms:
+            terms.append(part)
+    return ', '.join(terms)
+
+
+def parse_chinese_pinyin(text):
+    """
+    Parse a 'Chinese (pinyin)' response.
+    Returns a (chinese, pinyin) tuple, or None if nothing usable was found.
+    """
+    text = text.strip()
+
+    # Check if the format is "Chinese (pinyin)"
+    if '(' in text and ')' in text:
+        chinese = text.split('(')[0].strip()
+        pinyin = text.split('(')[1].split(')')[0].strip()
+        return (chinese, pinyin)
+
+    # Try to extract Chinese and pinyin from unformatted response
+    parts = text.split()
+    if len(parts) >= 2:
+        return (parts[0], ' '.join(parts[1:]))
+
+    return None
+
+
+def parse_batch_translations(text, batch):
+    """
+    Parse a batch response of 'English: Chinese (pinyin)' lines.
+    Returns a dictionary mapping phrases from batch to (chinese, pinyin) tuples.
+    """
+    results = {}
+
+    for line in text.strip().split('\n'):
+        if ':' not in line:
+            continue
+
+        # Extract English, Chinese, and pinyin
+        parts = line.split(':', 1)
+        english = parts[0].strip().strip('-').strip()
+        chinese_pinyin = parts[1].strip()
+
+        if '(' not in chinese_pinyin or ')' not in chinese_pinyin:
+            continue
+        chinese = chinese_pinyin.split('(')[0].strip()
+        pinyin = chinese_pinyin.split('(')[1].split(')')[0].strip()
+
+        # Find the matching original English phrase from our batch
+        for original_phrase in batch:
+            # Try to match the cleaned version of the original phrase
+            cleaned_original = clean_term_for_translation(original_phrase)
+            if cleaned_original.lower() == english.lower() or original_phrase.lower() == english.lower():
+                results[original_phrase] = (chinese, pinyin)
+                break
+            # Fallback for partial matches
+            elif cleaned_original.lower() in english.lower() or english.lower() in cleaned_original.lower():
+                results[original_phrase] = (chinese, pinyin)
+                break
+
+    return results
+
+
+def get_openai():
+    """Import the OpenAI client and configure the API key, or return None."""
+    import openai
+
+    if not openai.api_key:
+        try:
+            openai.api_key = os.environ["OPENAI_API_KEY"]
+        except KeyError:
+            print("Error: OpenAI API key not found. Please set the OPENAI_API_KEY environment variable.")
+            return None
+    return openai
+
+
+def translate_term_openai(term):
+    """Translate a single term using OpenAI API. Returns (chinese, pinyin) or None."""
+    openai = get_openai()
+    if not openai:
+        return None
+
+    cleaned_term = clean_term_for_translation(term)
+    prompt = f"Translate this English term to Chinese with pinyin: '{cleaned_term}'."
+    if cleaned_term != term:
+        # The other terms tell "cardigan" the sweater from "cardigan, Cardigan Welsh corgi" the dog
+        prompt += f" It is the first term of the label '{term}'."
+    prompt += " Format as 'Chinese (pinyin)'."
+
+    try:
+        response = openai.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": "You are a professional translator. Provide only the Chinese translation and pinyin, nothing else."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.3
+        )
+        return parse_chinese_pinyin(response.choices[0].message.content)
+
+    except Exception as e:
+        print(f"Error translating '{term}': {e}")
+        return None
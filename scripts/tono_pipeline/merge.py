@@ -0,0 +1,50 @@
+"""Merge translated labels into the app's translations file."""
+from .common import is_missing, load_translations, save_translations
+
+
+def merge_translations(base, additions, overwrite=False, include_incomplete=False):
+    """
+    Merge entries from additions into base, matching on lowercased English.
+    Returns the merged data and a (added, updated, skipped) tuple of counts.
+    """
+    merged = [dict(entry) for entry in base["objects"]]
+    positions = {entry["english"].lower(): i for i, entry in enumerate(merged)}
+    added = updated = skipped = 0
+
+    for entry in additions["objects"]:
+        if is_missing(entry) and not include_incomplete:
+            skipped += 1
+            continue
+
+        key = entry["english"].lower()
+        if key not in positions:
+            positions[key] = len(merged)
+            merged.append(dict(entry))
+            added += 1
+        elif overwrite:
+            merged[positions[key]] = dict(entry)
+            updated += 1
+        else:
+            skipped += 1
+
+    return {"objects": merged}, (added, updated, skipped)
+
+
+def run(args):
+    base = load_translations(args.base)
+    if not base:
+        return 1
+
+    for filename in args.files:
+        additions = load_translations(filename)
+        if not additions:
+            return 1
+
+        base, (added, updated, skipped) = merge_translations(
+            base, additions, overwrite=args.overwrite, include_incomplete=args.include_incomplete
+        )
+        print(f"{filename}: added {added}, updated {updated}, skipped {skipped}")
+
+    save_translations(base, args.output)
+    print(f"Saved {len(base['objects'])} translations to {args.output}")
+    return 0
@@ -0,0 +1,56 @@
+"""Find and fix missing translations in an existing translations file."""
+from .common import is_missing, load_translations, save_translations
+from .singleflight import TranslationRegistry, default_registry
+
+
+def fix_missing_translations(data, registry=default_registry, workers=1):
+    """Find and fix missing translations in the data."""
+    missing_labels = [entry["english"] for entry in data["objects"] if is_missing(entry)]
+    missing_count = len(missing_labels)
+
+    print(f"Found {missing_count} entries with missing translations")
+    registry.count("labels", missing_count)
+
+    # One request per group of labels; the result is shared by every label in the group
+    results = registry.translate_all(missing_labels, workers=workers)
+
+    fixed_count = 0
+    for i, entry in enumerate(data["objects"]):
+        if is_missing(entry):
+            result = results.get(entry["english"])
+            if result:
+                entry["chinese"], entry["pinyin"] = result
+                fixed_count += 1
+                print(f"Translated {i+1}: {entry['english']} → {entry['chinese']} ({entry['pinyin']})")
+            else:
+                print(f"  Failed to translate: {entry['english']}")
+
+    print(f"Fixed {fixed_count} out of {missing_count} missing translations")
+
+    # Check if there are still missing translations
+    still_missing = sum(1 for entry in data["objects"] if is_missing(entry))
+    if still_missing > 0:
+        print(f"Warning: {still_missing} entries still have missing translations")
+    else:
+        print("All translations have been fixed!")
+
+    return data
+
+
+def run(args):
+    print("Loading translations...")
+    data = load_translations(args.input)
+    if not data:
+        return 1
+
+    print("Fixing missing translations...")
+    registry = TranslationRegistry(cache_path=args.cache)
+    fixed_data = fix_missing_translations(data, registry=registry, workers=args.workers)
+    registry.save()
+    registry.report()
+
+    save_translations(fixed_data, args.output)
+    print(f"Saved fixed translations to {args.output}")
+
+    print("Done!")
+    return 0
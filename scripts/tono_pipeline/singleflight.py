@@ -0,0 +1,255 @@
+"""
+Request coalescing for translation calls.
+
+Labels are grouped when they name the same thing (see `group_by_term`). A
+`SingleFlight` registry then makes sure each group is requested at most once:
+concurrent callers asking for a group that is already in flight wait for that
+request and share its result, and later callers get the stored result. Failed
+requests (None) are not stored, so a later pass can retry them.
+"""
+import json
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .common import canonicalize_term, get_openai, translate_term_openai
+
+
+def adds_other_terms(key):
+    """True if a canonical label's extra terms name something other than its head term."""
+    terms = key.split(", ")
+    # English compounds end in their head noun: "computer mouse" is a mouse, "Cardigan Welsh corgi" is not a cardigan
+    head = terms[0].split()[-1]
+    return any(term.split()[-1] != head for term in terms[1:])
+
+
+def group_by_term(labels):
+    """
+    Group labels that name the same thing: {key: [labels]}, in the order keys are first seen.
+    Labels share a group when their canonical labels match, or when one is the bare
+    head term ("mouse") and the other only adds terms for it ("mouse, computer mouse").
+    The key is the longest canonical label in the group and the first label is its
+    representative, whose full text is sent for translation.
+    """
+    groups = {}
+    for label in labels:
+        groups.setdefault(canonicalize_term(label), []).append(label)
+
+    # Each bare head term joins the first longer label that only adds terms for it
+    bare_terms = {}
+    for key in groups:
+        head = key.split(", ")[0]
+        if head != key and head in groups and head not in bare_terms.values() and not adds_other_terms(key):
+            bare_terms[key] = head
+
+    merged = {}
+    for key, group in groups.items():
+        if key in bare_terms.values():
+            continue
+        merged[key] = group + groups[bare_terms[key]] if key in bare_terms else group
+    return merged
+
+
+class SingleFlight:
+    """Run a function at most once per key at a time, and remember successful results."""
+
+    def __init__(self, results=None):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._results = dict(results or {})
+        self.stats = Counter()
+
+    def get(self, key):
+        with self._lock:
+            return self._results.get(key)
+
+    def remember(self, key, result):
+        """Store a result obtained outside do(), e.g. from a batch request."""
+        if result is not None:
+            with self._lock:
+                self._results[key] = result
+
+    def results(self):
+        with self._lock:
+            return dict(self._results)
+
+    def do(self, key, fn, *args):
+        """Return fn(*args), sharing the call with any concurrent caller for the same key."""
+        with self._lock:
+            self.stats["calls"] += 1
+            if key in self._results:
+                self.stats["cached"] += 1
+                return self._results[key]
+
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+                self.stats["executed"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            with self._lock:
+                del self._calls[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._calls[key]
+            if result is not None:
+                self._results[key] = result
+        future.set_result(result)
+        return result
+
+
+class TranslationRegistry:
+    """Groups labels and coalesces their OpenAI translation requests."""
+
+    def __init__(self, cache_path=None, delay=1):
+        self.cache_path = cache_path
+        # Seconds to wait after each request that is actually sent, to avoid rate limiting
+        self.delay = delay
+        self.flight = SingleFlight(self._load_cache())
+        self.stats = Counter()
+        self._keys = {}
+        self._lock = threading.Lock()
+
+    def _load_cache(self):
+        if not self.cache_path:
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return {term: tuple(result) for term, result in json.load(f).items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Error loading translation cache: {e}")
+            return {}
+
+    def save(self):
+        """Persist successful results so other workflows can reuse them."""
+        if not self.cache_path:
+            return
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(self.flight.results(), f, indent=2, ensure_ascii=False)
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.stats[name] += amount
+
+    def _request(self, label):
+        # Without a client nothing is sent, so don't count a request
+        if not get_openai():
+            return None
+        self.count("sent")
+        result = translate_term_openai(label)
+        if self.delay:
+            time.sleep(self.delay)
+        return result
+
+    def _group(self, labels):
+        """Group labels and remember each label's group key for lookup()."""
+        groups = group_by_term(labels)
+        with self._lock:
+            for key, group in groups.items():
+                self._keys.update((label, key) for label in group)
+        return groups
+
+    def _key(self, label):
+        with self._lock:
+            return self._keys.get(label) or canonicalize_term(label)
+
+    def stored(self, key):
+        """
+        Return the stored result for a group key. Like group_by_term, a bare head term
+        ("mouse") and a label that only adds terms for it ("mouse, computer mouse") share
+        a result, so workflows that saw different forms of a label reuse each other's cache.
+        """
+        result = self.flight.get(key)
+        if result is not None:
+            return result
+
+        head = key.split(", ")[0]
+        if head != key:
+            result = None if adds_other_terms(key) else self.flight.get(head)
+        else:
+            result = next((
+                stored for stored_key, stored in self.flight.results().items()
+                if stored_key.split(", ")[0] == key and not adds_other_terms(stored_key)
+            ), None)
+
+        # Store it under this key too, so later lookups and the saved cache find it directly
+        self.flight.remember(key, result)
+        return result
+
+    def lookup(self, label):
+        """Return a known translation for a label without making a request."""
+        return self.stored(self._key(label))
+
+    def remember(self, label, result):
+        self.flight.remember(self._key(label), result)
+
+    def translate_all(self, labels, workers=1):
+        """
+        Translate labels with at most one request per group, sending the representative label.
+        Returns {label: (chinese, pinyin)} for every label that got a translation.
+        Labels are not counted here; callers count them once with count("labels").
+        """
+        groups = self._group(labels)
+
+        translations = {}
+        to_request = {}
+        for key, group in groups.items():
+            result = self.stored(key)
+            if result:
+                self.count("reused", len(group))
+                translations.update((label, result) for label in group)
+            else:
+                to_request[key] = group
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            results = executor.map(
+                lambda item: self.flight.do(item[0], self._request, item[1][0]), to_request.items()
+            )
+            for group, result in zip(to_request.values(), results):
+                if result:
+                    # Fan the shared result back out to every original label
+                    translations.update((label, result) for label in group)
+
+        return translations
+
+    def pending(self, labels):
+        """
+        Group labels for a batch request.
+        Returns {key: [labels]} for the groups without a known result.
+        """
+        groups = {}
+        for key, group in self._group(labels).items():
+            if self.stored(key) is None:
+                groups[key] = group
+            else:
+                self.count("reused", len(group))
+        return groups
+
+    def report(self):
+        """Print how many duplicate requests were eliminated, counted in labels."""
+        labels = self.stats["labels"]
+        sent = self.stats["sent"]
+        reused = self.stats["reused"]
+        eliminated = labels - sent
+        print(
+            f"Translation requests: {labels} labels, {sent} sent, {eliminated} duplicates eliminated "
+            f"({reused} reused a stored result, {eliminated - reused} shared a request with another label)"
+        )
+
+
+# Shared by every command in the process, so separate workflows reuse results
+default_registry = TranslationRegistry()
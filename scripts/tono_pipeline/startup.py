@@ -0,0 +1,73 @@
+"""
+Check that quick pipeline commands stay within their startup budget.
+
+Runs `python -X importtime` on the imports each fast command needs and fails
+if any heavy dependency gets pulled in or the time spent importing modules
+beyond a bare interpreter's startup exceeds the budget:
+
+    python -m tono_pipeline.startup --budget-ms 25
+"""
+import argparse
+import subprocess
+import sys
+
+FAST_COMMANDS = ["validate", "merge", "check"]
+HEAVY_MODULES = {"openai", "requests", "bs4", "numpy", "pyarrow"}
+
+
+def import_times(code):
+    """Run code under -X importtime and return {module: self time in us}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        # Lines look like "import time:       123 |        456 | package.module"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def measure_imports(command, baseline):
+    """
+    Import the CLI and one command module under -X importtime.
+    Returns (import time in ms beyond the baseline, set of top-level modules imported).
+    """
+    times = import_times(f"import tono_pipeline.cli, tono_pipeline.{command}")
+    extra_us = sum(us for name, us in times.items() if name not in baseline)
+    return extra_us / 1000, {name.split(".")[0] for name in times}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check pipeline startup import time.")
+    parser.add_argument("--budget-ms", type=float, default=25.0, help="Maximum import time per command beyond interpreter startup")
+    parser.add_argument("commands", nargs="*", default=FAST_COMMANDS)
+    args = parser.parse_args(argv)
+
+    # Modules every interpreter imports at startup (encodings, site, ...)
+    baseline = set(import_times("pass"))
+
+    failed = False
+    for command in args.commands:
+        total_ms, modules = measure_imports(command, baseline)
+        heavy = sorted(modules & HEAVY_MODULES)
+
+        status = "OK"
+        if heavy or total_ms > args.budget_ms:
+            status = "FAIL"
+            failed = True
+        print(f"{command:<10} {total_ms:7.1f} ms  {status}")
+        if heavy:
+            print(f"  imports heavy modules: {', '.join(heavy)}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""
+Columnar vocabulary store.
+
+Imports every translation file into one Arrow table (one row per entry, with a
+`source` column naming the file it came from) and answers QA questions with
+vectorized Arrow compute kernels instead of Python loops. The store is written
+as an uncompressed Arrow IPC file so it can be memory-mapped and read without
+copying; `.parquet` paths are supported for import and export too.
+
+pyarrow is only needed for this command (`pip install -e ".[store]"`).
+"""
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError as e:
+    raise ImportError(f'{e}. The store command needs pyarrow: pip install -e ".[store]"') from e
+
+from .common import RESOURCES_DIR, SCRIPT_DIR, load_translations, save_translations
+
+FIELDS = ["english", "chinese", "pinyin", "category"]
+
+SCHEMA = pa.schema([
+    ("source", pa.dictionary(pa.int32(), pa.string())),
+    ("english", pa.string()),
+    ("chinese", pa.string()),
+    ("pinyin", pa.string()),
+    ("category", pa.string()),
+])
+
+DEFAULT_SOURCES = [
+    os.path.join(RESOURCES_DIR, "translations.json"),
+    os.path.join(RESOURCES_DIR, "translations copy.json"),
+    os.path.join(RESOURCES_DIR, "yolo_translations.json"),
+    os.path.join(SCRIPT_DIR, "translated_labels.json"),
+    os.path.join(SCRIPT_DIR, "translated_labels_fixed.json"),
+    os.path.join(SCRIPT_DIR, "missing_translations.json"),
+]
+
+
+def source_name(filename):
+    """Name a source after its file, e.g. "translations copy"."""
+    return os.path.splitext(os.path.basename(filename))[0]
+
+
+def import_translations(filenames):
+    """Build a vocabulary table from translation JSON files."""
+    columns = {name: [] for name in ["source"] + FIELDS}
+    for filename in filenames:
+        data = load_translations(filename)
+        if not data:
+            continue
+        if not isinstance(data, dict) or not isinstance(data.get("objects"), list):
+            print(f"Skipping {filename}: no \"objects\" list")
+            continue
+
+        source = source_name(filename)
+        for entry in data["objects"]:
+            columns["source"].append(source)
+            for field in FIELDS:
+                columns[field].append(entry.get(field, ""))
+
+    return pa.table(columns, schema=SCHEMA)
+
+
+def export_translations(table, source=None):
+    """Convert a vocabulary table (optionally one source) to the app's JSON schema."""
+    if source:
+        table = table.filter(pc.equal(table["source"].cast(pa.string()), source))
+    return {"objects": table.select(FIELDS).to_pylist()}
+
+
+def write_store(table, path):
+    """Write the table as Parquet or as an uncompressed Arrow IPC file."""
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        pq.write_table(table, path)
+        return
+
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def read_store(path):
+    """Read a store; Arrow IPC files are memory-mapped rather than copied."""
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        return pq.read_table(path, memory_map=True)
+
+    # The table's buffers point into the mapping, which stays open while they are referenced
+    return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+
+def with_key(table):
+    """Add a lowercased English column, matching how the app looks translations up."""
+    return table.append_column("key", pc.utf8_lower(table["english"]))
+
+
+def is_blank(column):
+    """Vectorized check for null or whitespace-only strings."""
+    return pc.fill_null(pc.equal(pc.utf8_trim_whitespace(column), ""), True)
+
+
+def missing(table, fields=("chinese", "pinyin")):
+    """Return the rows where any of the given fields is blank."""
+    mask = is_blank(table[fields[0]])
+    for field in fields[1:]:
+        mask = pc.or_(mask, is_blank(table[field]))
+    return table.filter(mask)
+
+
+def duplicates(table, across_sources=False):
+    """Return (source, key, count) groups whose English appears more than once."""
+    keys = ["key"] if across_sources else ["source", "key"]
+    table = with_key(table)
+    if not across_sources:
+        table = table.set_column(0, "source", table["source"].cast(pa.string()))
+
+    counts = table.group_by(keys).aggregate([("english", "count")])
+    return counts.filter(pc.greater(counts["english_count"], 1)).sort_by(
+        [("english_count", "descending"), ("key", "ascending")]
+    )
+
+
+def diff(table, left, right):
+    """
+    Compare two sources on lowercased English.
+    Returns (only in left, only in right, changed) tables.
+    """
+    sources = table["source"].cast(pa.string())
+    columns = ["key", "english", "chinese", "pinyin"]
+    left_table = with_key(table.filter(pc.equal(sources, left))).select(columns)
+    right_table = with_key(table.filter(pc.equal(sources, right))).select(columns)
+
+    # Duplicate keys inside one source would multiply rows in the join
+    left_table = left_table.group_by("key").aggregate([(c, "first") for c in columns[1:]])
+    right_table = right_table.group_by("key").aggregate([(c, "first") for c in columns[1:]])
+
+    joined = left_table.join(
+        right_table, keys="key", join_type="full outer", left_suffix="_left", right_suffix="_right"
+    )
+    in_left = pc.is_valid(joined["english_first_left"])
+    in_right = pc.is_valid(joined["english_first_right"])
+    both = pc.and_(in_left, in_right)
+    # Compare with nulls as blanks, otherwise a translation missing on one side compares as null and is dropped
+    changed = pc.and_(both, pc.or_(
+        pc.not_equal(pc.fill_null(joined["chinese_first_left"], ""), pc.fill_null(joined["chinese_first_right"], "")),
+        pc.not_equal(pc.fill_null(joined["pinyin_first_left"], ""), pc.fill_null(joined["pinyin_first_right"], "")),
+    ))
+
+    return (
+        joined.filter(pc.and_(in_left, pc.invert(in_right))),
+        joined.filter(pc.and_(in_right, pc.invert(in_left))),
+        joined.filter(changed),
+    )
+
+
+def summary(table):
+    """Per-source entry counts, unique English and missing fields."""
+    table = with_key(table).set_column(0, "source", table["source"].cast(pa.string()))
+    table = table.append_column("missing_chinese", is_blank(table["chinese"]))
+    table = table.append_column("missing_pinyin", is_blank(table["pinyin"]))
+    return table.group_by("source").aggregate([
+        ("english", "count"),
+        ("key", "count_distinct"),
+        ("missing_chinese", "sum"),
+        ("missing_pinyin", "sum"),
+    ]).sort_by("source")
+
+
+def print_rows(table, columns, limit):
+    """Print up to limit rows of the given columns."""
+    for row in table.select(columns).slice(0, limit).to_pylist():
+        print("  " + " | ".join(str(row[c]) for c in columns))
+    if table.num_rows > limit:
+        print(f"  ... {table.num_rows - limit} more")
+
+
+def run(args):
+    if args.action == "import":
+        table = import_translations(args.files or DEFAULT_SOURCES)
+        write_store(table, args.store)
+        print(f"Saved {table.num_rows} entries from {len(pc.unique(table['source']))} sources to {args.store}")
+        return 0
+
+    if not os.path.exists(args.store):
+        print(f"Error: store {args.store} not found. Create it with: tono-pipeline store --store {args.store} import")
+        return 1
+
+    try:
+        table = read_store(args.store)
+    except (pa.ArrowInvalid, OSError) as e:
+        print(f"Error: cannot read store {args.store}: {e}")
+        return 1
+
+    # An unknown source name would silently match nothing
+    requested = [args.left, args.right] if args.action == "diff" else args.source or []
+    sources = pc.unique(table["source"].cast(pa.string())).to_pylist()
+    unknown = [name for name in requested if name not in sources]
+    if unknown:
+        print(f"Error: unknown source {', '.join(unknown)}. Available sources: {', '.join(sorted(sources))}")
+        return 1
+
+    if args.action in ("summary", "missing", "duplicates") and args.source:
+        table = table.filter(pc.is_in(table["source"].cast(pa.string()), pa.array(args.source)))
+
+    if args.action == "export":
+        data = export_translations(table, args.source[0] if args.source else None)
+        save_translations(data, args.output)
+        print(f"Saved {len(data['objects'])} translations to {args.output}")
+
+    elif args.action == "summary":
+        result = summary(table)
+        print("source | entries | unique | missing chinese | missing pinyin")
+        print_rows(result, result.column_names, result.num_rows)
+
+    elif args.action == "missing":
+        result = missing(table, args.fields)
+        print(f"Found {result.num_rows} entries missing {' or '.join(args.fields)}")
+        print_rows(result, ["source", "english"], args.limit)
+
+    elif args.action == "duplicates":
+        result = duplicates(table, args.across_sources)
+        print(f"Found {result.num_rows} duplicated English labels")
+        print_rows(result, result.column_names, args.limit)
+
+    elif args.action == "diff":
+        only_left, only_right, changed = diff(table, args.left, args.right)
+        print(f"Only in {args.left}: {only_left.num_rows}")
+        print_rows(only_left, ["english_first_left"], args.limit)
+        print(f"Only in {args.right}: {only_right.num_rows}")
+        print_rows(only_right, ["english_first_right"], args.limit)
+        print(f"Different translations: {changed.num_rows}")
+        print_rows(changed, ["key", "chinese_first_left", "chinese_first_right"], args.limit)
+
+    return 0
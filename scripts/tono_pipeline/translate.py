@@ -0,0 +1,239 @@
+"""Translate extracted labels to Chinese with pinyin."""
+import os
+import time
+from urllib.parse import quote
+
+from .common import (
+    OPENAI_MODEL,
+    clean_term_for_translation,
+    get_openai,
+    is_missing,
+    load_translations,
+    parse_batch_translations,
+    save_translations,
+)
+from .singleflight import TranslationRegistry, default_registry
+
+# Note: You'll need to get your own API key for DeepL
+DEEPL_API_KEY = os.environ.get("DEEPL_API_KEY", "YOUR_API_KEY_HERE")
+
+
+def translate_text_deepl(text, target_lang="ZH"):
+    """Translate text using DeepL API."""
+    import requests
+
+    url = "https://api-free.deepl.com/v2/translate"
+    params = {
+        "auth_key": DEEPL_API_KEY,
+        "text": text,
+        "target_lang": target_lang
+    }
+
+    try:
+        response = requests.post(url, data=params)
+        if response.status_code == 200:
+            result = response.json()
+            return result["translations"][0]["text"]
+        else:
+            print(f"Translation error: {response.status_code}")
+            return None
+    except Exception as e:
+        print(f"Translation request error: {e}")
+        return None
+
+
+def translate_text_google(text, target_lang="zh-CN"):
+    """Translate text using Google Translate (no API key required, but limited usage)."""
+    import requests
+
+    base_url = "https://translate.googleapis.com/translate_a/single"
+    url = f"{base_url}?client=gtx&sl=en&tl={target_lang}&dt=t&q={quote(text)}"
+
+    try:
+        response = requests.get(url)
+        if response.status_code == 200:
+            result = response.json()
+            return result[0][0][0]
+        else:
+            print(f"Translation error: {response.status_code}")
+            return None
+    except Exception as e:
+        print(f"Translation request error: {e}")
+        return None
+
+
+def translate_text_openai(text_list, batch_size=15, registry=None):
+    """
+    Translate a list of English phrases to Chinese with pinyin using OpenAI API.
+    Returns a dictionary mapping English phrases to (Chinese, pinyin) tuples.
+    Each batch request that is sent is counted in the registry, if given.
+    """
+    openai = get_openai()
+    if not openai:
+        return {}
+
+    results = {}
+
+    # Process in batches to avoid hitting token limits
+    for i in range(0, len(text_list), batch_size):
+        batch = text_list[i:i+batch_size]
+        print(f"Translating batch {i//batch_size + 1}/{(len(text_list) + batch_size - 1)//batch_size}")
+
+        # Create a prompt for the batch
+        prompt = """Translate the following English terms to Chinese and provide the pinyin with tone marks.
+These are ImageNet class labels, so focus on translating the main concept accurately.
+For terms with scientific names or multiple descriptions, focus on the main concept (before the first comma).
+
+Format each response as 'English: Chinese (pinyin)'
+
+"""
+        for term in batch:
+            prompt += f"- {term}\n"
+
+        try:
+            if registry:
+                registry.count("sent")
+            response = openai.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": "You are a professional translator specializing in English to Chinese translation for computer vision and image recognition. Provide accurate translations with correct pinyin including tone marks. For terms with scientific names or multiple descriptions, focus on translating the main concept accurately."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3
+            )
+
+            results.update(parse_batch_translations(response.choices[0].message.content, batch))
+
+            # Avoid rate limiting
+            time.sleep(1)
+
+        except Exception as e:
+            print(f"OpenAI API error: {e}")
+            time.sleep(5)  # Wait longer on error
+
+    return results
+
+
+def translate_missing_terms(missing_terms, registry=default_registry, workers=1):
+    """Translate terms that were missed in the first pass."""
+    print(f"Attempting to translate {len(missing_terms)} missing terms...")
+
+    # Try a more direct approach with a simpler prompt, one request per group of labels
+    results = registry.translate_all(missing_terms, workers=workers)
+
+    for term, (chinese, pinyin) in results.items():
+        print(f"Successfully translated: {term} → {chinese} ({pinyin})")
+
+    return results
+
+
+def translate_labels(data, method="openai", registry=default_registry, workers=1):
+    """Translate all labels in the data."""
+    if not data or "objects" not in data:
+        print("Invalid data format")
+        return None
+
+    total = len(data["objects"])
+    print(f"Translating {total} labels...")
+
+    if method == "openai":
+        # Collect all English phrases that need translation
+        to_translate = [entry["english"] for entry in data["objects"] if is_missing(entry)]
+        # Count each label once, even if it goes through the second pass too
+        registry.count("labels", len(to_translate))
+        pending = registry.pending(to_translate)
+
+        print(f"Found {len(to_translate)} labels to translate ({len(pending)} unique terms not translated yet)")
+
+        # Translate in bulk using OpenAI, sending the representative full label of each group
+        representatives = [group[0] for group in pending.values()]
+        for label, result in translate_text_openai(representatives, registry=registry).items():
+            registry.remember(label, result)
+
+        # Update the data with translations, fanning each result out to every label with the same term
+        translated_count = 0
+        missing_terms = []
+
+        for entry in data["objects"]:
+            if not is_missing(entry):
+                continue
+            result = registry.lookup(entry["english"])
+            if result:
+                entry["chinese"], entry["pinyin"] = result
+                translated_count += 1
+            else:
+                # Keep track of terms that weren't translated
+                missing_terms.append(entry["english"])
+
+        print(f"Successfully translated {translated_count} labels")
+
+        # Check if there are any missing translations
+        if missing_terms:
+            print(f"Found {len(missing_terms)} terms without translations. Attempting to translate them individually...")
+            missing_translations = translate_missing_terms(missing_terms, registry, workers)
+
+            # Update the data with the missing translations
+            for entry in data["objects"]:
+                if entry["english"] in missing_translations:
+                    entry["chinese"], entry["pinyin"] = missing_translations[entry["english"]]
+                    translated_count += 1
+
+            print(f"After second pass: Successfully translated {translated_count} labels")
+
+        # Final verification
+        still_missing = 0
+        for entry in data["objects"]:
+            if is_missing(entry):
+                still_missing += 1
+                print(f"Still missing translation for: {entry['english']}")
+
+        if still_missing > 0:
+            print(f"Warning: {still_missing} labels still don't have translations")
+        else:
+            print("All labels have been successfully translated!")
+
+        registry.report()
+        return data
+
+    # Individual translations without pinyin
+    for i, entry in enumerate(data["objects"]):
+        if i % 10 == 0:
+            print(f"Progress: {i}/{total}")
+
+        # Skip if already translated
+        if entry["chinese"] and entry["pinyin"]:
+            continue
+
+        # For terms with scientific names, focus on the main concept
+        translation_term = clean_term_for_translation(entry["english"])
+
+        if method == "google":
+            chinese = translate_text_google(translation_term)
+        else:
+            chinese = translate_text_deepl(translation_term)
+
+        if chinese:
+            entry["chinese"] = chinese
+
+        # Avoid rate limiting
+        time.sleep(1)
+
+    return data
+
+
+def run(args):
+    data = load_translations(args.input)
+    if not data:
+        return 1
+
+    registry = TranslationRegistry(cache_path=args.cache)
+    translated_data = translate_labels(data, method=args.method, registry=registry, workers=args.workers)
+    registry.save()
+    if not translated_data:
+        return 1
+
+    save_translations(translated_data, args.output)
+    print(f"Saved translated labels to {args.output}")
+
+    print("Translation complete! Review the translations before adding to your app.")
+    return 0
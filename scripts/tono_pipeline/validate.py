@@ -0,0 +1,56 @@
+"""Check translation files for missing fields and duplicate entries."""
+from .common import is_missing, load_translations
+
+REQUIRED_FIELDS = ("english", "chinese", "pinyin", "category")
+
+
+def validate_translations(data):
+    """Return a list of problems found in a translations file."""
+    if not isinstance(data, dict) or not isinstance(data.get("objects"), list):
+        return ["Invalid data format: expected {\"objects\": [...]}"]
+
+    problems = []
+    seen = {}
+
+    for i, entry in enumerate(data["objects"]):
+        english = entry.get("english", "")
+        label = english or f"entry {i+1}"
+
+        for field in REQUIRED_FIELDS:
+            if field not in entry:
+                problems.append(f"{label}: missing field '{field}'")
+
+        if not english.strip():
+            problems.append(f"entry {i+1}: empty english")
+        elif is_missing(entry):
+            problems.append(f"{label}: missing translation")
+
+        # The app looks translations up by lowercased English, so these collide
+        key = english.lower()
+        if key in seen:
+            problems.append(f"{label}: duplicate of entry {seen[key] + 1}")
+        else:
+            seen[key] = i
+
+    return problems
+
+
+def run(args):
+    failed = False
+    for filename in args.files:
+        data = load_translations(filename)
+        if data is None:
+            failed = True
+            continue
+
+        problems = validate_translations(data)
+        count = len(data.get("objects", [])) if isinstance(data, dict) else 0
+        if problems:
+            failed = True
+            print(f"{filename}: {len(problems)} problem(s) in {count} entries")
+            for problem in problems:
+                print(f"  {problem}")
+        else:
+            print(f"{filename}: {count} entries OK")
+
+    return 1 if failed else 0